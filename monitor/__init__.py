@@ -3,31 +3,57 @@ Monitoring package for college announcement checks.
 
 Main modules:
 - monitor_core: Core monitoring logic (run_monitor)
-- models: Data classes (Announcement, MonitorState, Config)
+- models: Data classes (Announcement, MonitorState, FetchedPage, Config)
 - state: State file operations
 - config: Configuration loading
 - scraper: Web scraping and announcement detection
 - telegram_client: Telegram API integration
 - utils: Utilities and constants
+
+The scraper and telegram_client exports are resolved lazily (on first
+attribute access), so importing the package does not pull in requests or the
+HTML parsers.
 """
 
+from importlib import import_module
+from typing import Any
+
 from .monitor_core import run_monitor
-from .models import Announcement, MonitorState, Config
+from .models import Announcement, MonitorState, FetchedPage, Config
 from .state import load_state, save_state
 from .config import load_config
-from .scraper import fetch_page, extract_announcements, detect_announcements
-from .telegram_client import TelegramClient, send_public_announcement, send_private_error
+
+_LAZY_EXPORTS = {
+    "fetch_page": "scraper",
+    "extract_announcements": "scraper",
+    "extract_feed_items": "scraper",
+    "detect_announcements": "scraper",
+    "TelegramClient": "telegram_client",
+    "send_public_announcement": "telegram_client",
+    "send_private_error": "telegram_client",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import scraper/telegram_client exports on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(f".{module_name}", __name__), name)
+
 
 __all__ = [
     "run_monitor",
     "Announcement",
     "MonitorState",
+    "FetchedPage",
     "Config",
     "load_state",
     "save_state",
     "load_config",
     "fetch_page",
     "extract_announcements",
+    "extract_feed_items",
     "detect_announcements",
     "TelegramClient",
     "send_public_announcement",
@@ -5,16 +5,36 @@ Configuration loading from environment variables.
 from __future__ import annotations
 
 import os
+import re
+from typing import Optional, Sequence
 
 from .models import Config
 from .utils import (
     DEFAULT_TARGET_URL,
+    DEFAULT_FEED_URL,
     DEFAULT_MATCH_KEYWORDS,
     DEFAULT_SIMILARITY_THRESHOLD,
     DEFAULT_ERROR_THROTTLE_MINUTES,
 )
 
 
+def parse_keywords(match_keywords: str) -> tuple[str, ...]:
+    """Split comma-separated keywords into stripped, case-folded terms."""
+    return tuple(kw.strip().casefold() for kw in match_keywords.split(",") if kw.strip())
+
+
+def compile_keyword_pattern(keywords: Sequence[str]) -> Optional[re.Pattern[str]]:
+    """
+    Compile parsed keywords into one regex alternation.
+
+    Returns None when there are no keywords (an empty alternation would match
+    every text).
+    """
+    if not keywords:
+        return None
+    return re.compile("|".join(re.escape(kw) for kw in keywords))
+
+
 def load_config() -> Config:
     """
     Build a Config object using module-level defaults for non-secret values
@@ -27,6 +47,8 @@ def load_config() -> Config:
     state_file_default = os.path.join(os.path.dirname(__file__), "..", "state", "state.json")
     state_file = os.getenv("STATE_FILE", state_file_default)
     state_file = os.path.abspath(state_file)
+    # Created once here so save_state does not have to check on every write.
+    os.makedirs(os.path.dirname(state_file), exist_ok=True)
 
     # Monitoring on/off is controlled exclusively via MONITORING_ENABLED environment
     # variable. Defaults to True if not set (for local testing convenience), but in
@@ -38,6 +60,8 @@ def load_config() -> Config:
         # Default to enabled if not specified (for local testing).
         monitoring_enabled = True
 
+    keywords = parse_keywords(DEFAULT_MATCH_KEYWORDS)
+
     cfg = Config(
         target_url=DEFAULT_TARGET_URL,
         match_keywords=DEFAULT_MATCH_KEYWORDS,
@@ -48,5 +72,8 @@ def load_config() -> Config:
         state_file=state_file,
         monitoring_enabled=monitoring_enabled,
         error_throttle_minutes=DEFAULT_ERROR_THROTTLE_MINUTES,
+        feed_url=DEFAULT_FEED_URL,
+        keywords=keywords,
+        keyword_pattern=compile_keyword_pattern(keywords),
     )
     return cfg
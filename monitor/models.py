@@ -4,11 +4,12 @@ Data models for the monitoring system.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict, field
+import re
+from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Announcement:
     """Represents a detected announcement."""
 
@@ -17,8 +18,25 @@ class Announcement:
     pdf_url: Optional[str]
     first_detected: str  # ISO string
 
+    def to_json(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "text": self.text,
+            "pdf_url": self.pdf_url,
+            "first_detected": self.first_detected,
+        }
 
-@dataclass
+    @classmethod
+    def from_json(cls, raw: Dict[str, Any]) -> "Announcement":
+        return cls(
+            id=str(raw.get("id", "")),
+            text=str(raw.get("text", "")),
+            pdf_url=raw.get("pdf_url"),
+            first_detected=str(raw.get("first_detected", "")),
+        )
+
+
+@dataclass(slots=True)
 class MonitorState:
     """
     JSON-serialisable state consumed by the static webpage.
@@ -34,33 +52,43 @@ class MonitorState:
     error_history: list[Dict[str, str]] = field(default_factory=list)
     error_signature: Optional[str] = None
     error_last_alert_time: Optional[str] = None
+    # HTTP validators from the last fully processed page fetch, sent back as
+    # If-None-Match / If-Modified-Since so an unchanged page returns 304.
+    last_etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    # Digest of the last fully processed page body, for servers that send no
+    # validators but serve byte-identical pages.
+    last_body_hash: Optional[str] = None
+    # URL the validators and body hash above belong to; they are discarded
+    # when the monitored URL changes.
+    last_source_url: Optional[str] = None
 
     def to_json(self) -> Dict[str, Any]:
-        data: Dict[str, Any] = asdict(self)
-        data["announcement_history"] = [asdict(a) for a in self.announcement_history]
-        return data
+        # Built by hand rather than with dataclasses.asdict, which deep-copies
+        # every value only for the result to be serialised straight away.
+        return {
+            "monitoring_enabled": self.monitoring_enabled,
+            "last_run_time": self.last_run_time,
+            "last_run_status": self.last_run_status,
+            "announcement_history": [a.to_json() for a in self.announcement_history],
+            "error_history": self.error_history,
+            "error_signature": self.error_signature,
+            "error_last_alert_time": self.error_last_alert_time,
+            "last_etag": self.last_etag,
+            "last_modified": self.last_modified,
+            "last_body_hash": self.last_body_hash,
+            "last_source_url": self.last_source_url,
+        }
 
     @classmethod
     def from_json(cls, raw: Dict[str, Any]) -> "MonitorState":
         # Migrate legacy single announcement to history if needed
         history = []
         if "announcement_history" in raw:
-            for item in raw["announcement_history"]:
-                history.append(Announcement(
-                    id=str(item.get("id", "")),
-                    text=str(item.get("text", "")),
-                    pdf_url=item.get("pdf_url"),
-                    first_detected=str(item.get("first_detected", "")),
-                ))
+            history = [Announcement.from_json(item) for item in raw["announcement_history"]]
         elif "last_announcement" in raw and raw["last_announcement"]:
             # Migration path for existing state file
-            old_ann = raw["last_announcement"]
-            history.append(Announcement(
-                id=str(old_ann.get("id", "")),
-                text=str(old_ann.get("text", "")),
-                pdf_url=old_ann.get("pdf_url"),
-                first_detected=str(old_ann.get("first_detected", "")),
-            ))
+            history.append(Announcement.from_json(raw["last_announcement"]))
 
         # Migrate legacy single error to history if needed
         errors = raw.get("error_history", [])
@@ -78,9 +106,29 @@ class MonitorState:
             error_history=errors,
             error_signature=raw.get("error_signature"),
             error_last_alert_time=raw.get("error_last_alert_time"),
+            last_etag=raw.get("last_etag"),
+            last_modified=raw.get("last_modified"),
+            last_body_hash=raw.get("last_body_hash"),
+            last_source_url=raw.get("last_source_url"),
         )
 
 
+@dataclass
+class FetchedPage:
+    """
+    Result of fetching the target page.
+
+    When the server answers 304 Not Modified, `not_modified` is True and
+    `content` is empty; the caller should reuse the previous run's result.
+    """
+
+    content: bytes
+    encoding: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False
+
+
 @dataclass
 class Config:
     """
@@ -100,3 +148,10 @@ class Config:
     state_file: str
     monitoring_enabled: bool
     error_throttle_minutes: int = 60
+    # RSS/Atom feed to read instead of scraping target_url, if any.
+    feed_url: Optional[str] = None
+    # match_keywords parsed once at load time (stripped, lower-cased), and
+    # their precompiled alternation used for the substring check before any
+    # fuzzy scoring. See load_config.
+    keywords: tuple[str, ...] = ()
+    keyword_pattern: Optional[re.Pattern[str]] = None
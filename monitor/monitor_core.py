@@ -4,16 +4,27 @@ Core monitoring logic.
 
 from __future__ import annotations
 
+import hashlib
 import sys
 
 from .config import load_config
 from .models import Config
 from .state import load_state, save_state, update_for_error, update_for_success, should_send_error_alert
-from .scraper import fetch_page, extract_announcements, detect_announcements
-from .telegram_client import TelegramClient, send_public_announcement, send_private_error
 from .utils import debug_print, format_dt, now
 
 
+def _page_digest(content: bytes, cfg: Config) -> str:
+    """
+    Hash a fetched page body for change detection between runs.
+
+    The matching settings are folded in so that changing the keywords or
+    threshold forces a fresh parse of an otherwise identical page.
+    """
+    digest = hashlib.blake2b(content, digest_size=16)
+    digest.update(f"\0{cfg.match_keywords}\0{cfg.similarity_threshold}".encode("utf-8"))
+    return digest.hexdigest()
+
+
 def run_monitor() -> int:
     """
     Execute one monitoring run.
@@ -25,14 +36,20 @@ def run_monitor() -> int:
     except KeyError as exc:
         print(f"[monitor] Missing required environment variable: {exc}", file=sys.stderr)
         return 1
+    except OSError as exc:
+        # load_config creates the state directory.
+        print(f"[monitor] Cannot create state directory: {type(exc).__name__}: {exc}", file=sys.stderr)
+        return 1
 
     state = load_state(cfg.state_file)
-    telegram = TelegramClient(cfg.telegram_bot_token)
+
+    # One timestamp for the whole run, shared by detection and state updates.
+    run_time = now()
 
     if not cfg.monitoring_enabled:
         # Still update state so the webpage reflects OFF status.
         state.monitoring_enabled = False
-        state.last_run_time = format_dt(now())
+        state.last_run_time = format_dt(run_time)
         print("[monitor] Monitoring disabled via configuration.")
         try:
             save_state(cfg.state_file, state)
@@ -41,67 +58,108 @@ def run_monitor() -> int:
             return 1
         return 0
 
-    try:
-        html = fetch_page(cfg.target_url)
-        candidates = extract_announcements(html)
-        print(f"[monitor] Found {len(candidates)} candidate announcement(s)")
-        
-        announcements = detect_announcements(candidates, cfg)
+    # Imported here rather than at module level: requests, the HTML parsers and
+    # the fuzzy matcher are only needed when monitoring is enabled, so the
+    # disabled path above starts without paying for them.
+    from .scraper import fetch_page, extract_announcements, extract_feed_items, detect_announcements
+    from .telegram_client import TelegramClient, send_public_announcement, send_private_error
 
-        if not announcements:
-            debug_print("[monitor] No matching announcement found")
-            # Still update state with successful run status even if no announcements found
-            state = update_for_success(state, None, cfg)
-            try:
-                save_state(cfg.state_file, state)
-            except Exception as exc:
-                print(f"[monitor] Failed to save state: {type(exc).__name__}: {exc}", file=sys.stderr)
-                raise
-        else:
-            for announcement in announcements:
-                is_new = True
-                # Check if recently detected
-                for past_ann in state.announcement_history:
-                    if past_ann.id == announcement.id:
-                        is_new = False
-                        break
-
-                # Send alert FIRST (if needed), before updating state
-                # If send fails, exception propagates without saving state
-                if is_new:
-                    send_public_announcement(telegram, cfg, announcement, cfg.target_url)
-                else:
-                    debug_print("[monitor] Skipping alert (already notified)")
-                
-                # Only update and save state after successful send
-                state = update_for_success(state, announcement, cfg)
+    # The client's keep-alive session is closed when the run finishes.
+    with TelegramClient(cfg.telegram_bot_token) as telegram:
+        try:
+            source_url = cfg.feed_url or cfg.target_url
+            if state.last_source_url != source_url:
+                # The validators and hash describe another resource; sending
+                # them could get a 304 for a URL that was never processed.
+                state.last_etag = None
+                state.last_modified = None
+                state.last_body_hash = None
+            page = fetch_page(source_url, state.last_etag, state.last_modified)
+            body_hash = None if page.not_modified else _page_digest(page.content, cfg)
+
+            if page.not_modified or body_hash == state.last_body_hash:
+                # Unchanged since the last fully processed run: nothing new to
+                # parse, detect or send.
+                print("[monitor] Page unchanged since last run; skipping parse.")
+                state = update_for_success(state, None, cfg, run_time)
                 try:
                     save_state(cfg.state_file, state)
                 except Exception as exc:
                     print(f"[monitor] Failed to save state: {type(exc).__name__}: {exc}", file=sys.stderr)
                     raise
+                print("[monitor] Run completed successfully.")
+                return 0
 
-        print("[monitor] Run completed successfully.")
-        return 0
+            if cfg.feed_url:
+                candidates = extract_feed_items(page.content)
+            else:
+                candidates = extract_announcements(page.content, page.encoding)
+            print(f"[monitor] Found {len(candidates)} candidate announcement(s)")
+        
+            announcements = detect_announcements(candidates, cfg, run_time, state.announcement_history)
 
-    except Exception as exc:
-        error_message = f"{type(exc).__name__}: {exc}"
-        print(f"[monitor] Error during run: {error_message}", file=sys.stderr)
-        signature = type(exc).__name__
-        state = update_for_error(state, error_message, cfg)
-
-        if should_send_error_alert(state, signature, cfg):
-            if send_private_error(telegram, cfg, error_message):
-                # Only mark as sent if actually succeeded
-                state.error_signature = signature
-                state.error_last_alert_time = format_dt(now())
+            if not announcements:
+                debug_print("[monitor] No matching announcement found")
+                # Still update state with successful run status even if no announcements found
+                state = update_for_success(state, None, cfg, run_time)
             else:
-                # Send failed; don't update alert state so we'll try again next time
-                pass
+                # Ids notified on earlier runs (the same history detection saw).
+                known_ids = {past_ann.id for past_ann in state.announcement_history}
+                for announcement in announcements:
+                    is_new = announcement.id not in known_ids
+
+                    # Send alert FIRST (if needed), before updating state
+                    # If send fails, exception propagates without saving state
+                    if is_new:
+                        send_public_announcement(telegram, cfg, announcement, cfg.target_url)
+                    else:
+                        debug_print("[monitor] Skipping alert (already notified)")
+
+                    state = update_for_success(state, announcement, cfg, run_time)
+                    if not is_new:
+                        # Nothing was sent, so there is no delivery to record;
+                        # the history update is written by the next save.
+                        continue
+                    # Save right after a successful send so it is never repeated.
+                    try:
+                        save_state(cfg.state_file, state)
+                    except Exception as exc:
+                        print(f"[monitor] Failed to save state: {type(exc).__name__}: {exc}", file=sys.stderr)
+                        raise
+
+            # Remember the validators and body hash only once every alert went
+            # out, so a failed send is retried on a full parse rather than skipped.
+            state.last_etag = page.etag
+            state.last_modified = page.last_modified
+            state.last_body_hash = body_hash
+            state.last_source_url = source_url
+            try:
+                save_state(cfg.state_file, state)
+            except Exception as exc:
+                print(f"[monitor] Failed to save state: {type(exc).__name__}: {exc}", file=sys.stderr)
+                raise
 
-        try:
-            save_state(cfg.state_file, state)
-        except Exception as save_exc:
-            print(f"[monitor] Failed to save state: {type(save_exc).__name__}: {save_exc}", file=sys.stderr)
+            print("[monitor] Run completed successfully.")
+            return 0
 
-        return 1
+        except Exception as exc:
+            error_message = f"{type(exc).__name__}: {exc}"
+            print(f"[monitor] Error during run: {error_message}", file=sys.stderr)
+            signature = type(exc).__name__
+            state = update_for_error(state, error_message, cfg, run_time)
+
+            if should_send_error_alert(state, signature, cfg, run_time):
+                if send_private_error(telegram, cfg, error_message):
+                    # Only mark as sent if actually succeeded
+                    state.error_signature = signature
+                    state.error_last_alert_time = format_dt(run_time)
+                else:
+                    # Send failed; don't update alert state so we'll try again next time
+                    pass
+
+            try:
+                save_state(cfg.state_file, state)
+            except Exception as save_exc:
+                print(f"[monitor] Failed to save state: {type(save_exc).__name__}: {save_exc}", file=sys.stderr)
+
+            return 1
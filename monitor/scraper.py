@@ -4,31 +4,94 @@ Web scraping and announcement detection logic.
 
 from __future__ import annotations
 
+import codecs
+import re
 import ssl
 import requests
-from bs4 import BeautifulSoup
+from datetime import datetime
 from difflib import SequenceMatcher
+from functools import lru_cache
+from bs4 import BeautifulSoup, NavigableString, SoupStrainer
+from bs4.dammit import EncodingDetector
+from lxml import etree
 from requests.adapters import HTTPAdapter
 from urllib3.poolmanager import PoolManager
 from urllib3.util.retry import Retry
-from typing import Any, Dict
+from typing import Any, Dict, Optional, Sequence
 
-from .models import Announcement, Config
-from .utils import debug_print, format_dt, now
+from .config import compile_keyword_pattern, parse_keywords
+from .models import Announcement, Config, FetchedPage
+from .utils import debug_print, format_dt, now, MAX_PAGE_BYTES
 import urllib3
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional; fall back to BeautifulSoup + lxml.
+    LexborHTMLParser = None
+
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # rapidfuzz is optional; fall back to difflib.
+    fuzz = process = None
+
 # Suppress SSL warnings for sites with weak DH keys
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
+# Only the notifications ticker is needed on the happy path, so the first parse
+# materialises just that subtree. The broader strainer keeps enough of the page
+# (list items, links and carousel divs) for the fallback strategies.
+_TICKER_STRAINER = SoupStrainer("div", class_=lambda c: bool(c) and "tg-ticker" in c.split())
+_FALLBACK_STRAINER = SoupStrainer(["li", "a", "div"])
+
+# Elements whose text bs4 stores as Script/Stylesheet/TemplateString/RubyText
+# strings, which get_text(strip=True) leaves out. The lexbor and streamed
+# paths skip them too so every path yields the same text.
+_NON_TEXT_TAGS = frozenset({"script", "style", "template", "rp", "rt"})
+
+# Links count as PDFs when the path ends in .pdf (any case), including URLs
+# with a query string or fragment such as "notice.pdf?v=2".
+_PDF_HREF_RE = re.compile(r"\.pdf(?:$|[?#])", re.IGNORECASE)
+
+
+def _is_pdf_href(href: str) -> bool:
+    """Return True if an href points at a PDF document."""
+    return _PDF_HREF_RE.search(href) is not None
 
-def fetch_page(url: str) -> str:
+
+# Connect/read timeouts (seconds) for the page fetch.
+_FETCH_TIMEOUT = (5, 30)
+
+
+def _build_ssl_context() -> ssl.SSLContext:
+    """Relaxed SSL context (for weak DH keys / SSL configs on older servers)."""
+    ssl_context = ssl.create_default_context()
+    ssl_context.set_ciphers("DEFAULT:@SECLEVEL=1")
+    ssl_context.check_hostname = False
+    ssl_context.verify_mode = ssl.CERT_NONE
+    return ssl_context
+
+
+class _WeakSSLAdapter(HTTPAdapter):
+    """HTTPAdapter whose connection pools use a caller-supplied SSL context."""
+
+    def __init__(self, ssl_context: ssl.SSLContext, *args: Any, **kwargs: Any) -> None:
+        self._ssl_context = ssl_context
+        super().__init__(*args, **kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> Any:
+        kwargs["ssl_context"] = self._ssl_context
+        return super().init_poolmanager(*args, **kwargs)
+
+
+@lru_cache(maxsize=1)
+def _get_session() -> requests.Session:
     """
-    Fetch target page and return HTML text.
+    Build the HTTP session used for page fetches (once per process).
 
-    Uses:
-    - Relaxed SSL context (for weak DH keys on older servers)
-    - Automatic retries with exponential backoff for transient failures
-      (DNS errors, timeouts, connection resets, 5xx responses)
+    Created lazily rather than at import time so importing the package never
+    touches SSL/network setup (set_ciphers can fail on some OpenSSL builds, and
+    that should surface as a run error, not an import error). Reusing the
+    session keeps connections alive across retries and repeated fetches.
     """
     # ------------------------------------------------------------------
     # Retry strategy (handles transient DNS / connection issues)
@@ -44,39 +107,91 @@ def fetch_page(url: str) -> str:
         raise_on_status=False,
     )
 
-    # ------------------------------------------------------------------
-    # Relaxed SSL context (for weak SSL configs)
-    # ------------------------------------------------------------------
-    ssl_context = ssl.create_default_context()
-    ssl_context.set_ciphers("DEFAULT:@SECLEVEL=1")
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
-
-    class CustomHTTPAdapter(HTTPAdapter):
-        def __init__(self, *args, **kwargs):
-            super().__init__(max_retries=retry_strategy, *args, **kwargs)
-
-        def init_poolmanager(self, *args, **kwargs):
-            kwargs["ssl_context"] = ssl_context
-            return super().init_poolmanager(*args, **kwargs)
-
     # ------------------------------------------------------------------
     # Session with retry + custom SSL
     # ------------------------------------------------------------------
     session = requests.Session()
-    adapter = CustomHTTPAdapter()
+    adapter = _WeakSSLAdapter(
+        _build_ssl_context(),
+        pool_connections=4,
+        pool_maxsize=4,
+        max_retries=retry_strategy,
+    )
     session.mount("https://", adapter)
     session.mount("http://", adapter)
+    return session
 
-    resp = session.get(url, timeout=30, verify=False)
-    resp.raise_for_status()
-    return resp.text
 
+def fetch_page(url: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> FetchedPage:
+    """
+    Fetch target page and return its raw HTML bytes with response metadata.
+
+    The encoding is only set when the server states a charset in its
+    Content-Type header; otherwise it is None and the parser detects it from
+    the document itself (e.g. <meta charset>).
+
+    If `etag` / `last_modified` from a previous fetch are given, the request is
+    made conditional; a 304 response comes back with `not_modified=True`.
 
-def extract_announcements(html: str) -> list[Dict[str, Any]]:
+    Uses a shared session (see _get_session) with:
+    - Relaxed SSL context (for weak DH keys on older servers)
+    - Automatic retries with exponential backoff for transient failures
+      (DNS errors, timeouts, connection resets, 5xx responses)
+    - Keep-alive connection pooling
+    - Streamed download that aborts once the body exceeds MAX_PAGE_BYTES
+    """
+    headers: Dict[str, str] = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+
+    with _get_session().get(url, headers=headers, timeout=_FETCH_TIMEOUT, verify=False, stream=True) as resp:
+        if resp.status_code == 304:
+            debug_print("[fetch] Page not modified since last fetch")
+            return FetchedPage(content=b"", etag=etag, last_modified=last_modified, not_modified=True)
+        resp.raise_for_status()
+
+        declared_length = resp.headers.get("Content-Length", "")
+        if declared_length.isdigit() and int(declared_length) > MAX_PAGE_BYTES:
+            raise RuntimeError(f"Page too large: {declared_length} bytes (limit {MAX_PAGE_BYTES})")
+
+        # Keep the chunks and join once at the end: a single copy of the body,
+        # rather than growing a bytearray and copying it again into bytes.
+        chunks: list[bytes] = []
+        size = 0
+        for chunk in resp.iter_content(chunk_size=65536):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size > MAX_PAGE_BYTES:
+                raise RuntimeError(f"Page too large: over {MAX_PAGE_BYTES} bytes")
+
+        # requests falls back to ISO-8859-1 for text/* responses without a charset,
+        # which would mis-decode UTF-8 pages, so only trust an explicit charset.
+        content_type = resp.headers.get("Content-Type", "").lower()
+        encoding = resp.encoding if "charset=" in content_type else None
+        if encoding:
+            # An unknown charset would make both parsers raise LookupError;
+            # drop it and let them detect the encoding from <meta charset>.
+            try:
+                codecs.lookup(encoding)
+            except LookupError:
+                encoding = None
+        return FetchedPage(
+            content=b"".join(chunks),
+            encoding=encoding,
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+
+
+def extract_announcements(html: bytes, encoding: Optional[str] = None) -> list[Dict[str, Any]]:
     """
     Extract candidate announcement blocks from the HTML.
 
+    The page is parsed with selectolax's lexbor backend when it is installed
+    and with BeautifulSoup + lxml otherwise; both apply the same strategies.
+
     Primary strategy (college-specific):
     - Look for <a> elements with class "active" that are nested anywhere inside
       a <div> with class "owl-item".
@@ -88,82 +203,336 @@ def extract_announcements(html: str) -> list[Dict[str, Any]]:
       generic heuristic based on <li> and <a> tags so the script still works
       even if the page structure changes.
     """
-    soup = BeautifulSoup(html, "html.parser")
-    candidates: list[Dict[str, Any]] = []
+    # Resolved once so every parser and strategy decodes the page the same way.
+    encoding = _document_encoding(html, encoding)
+    if LexborHTMLParser is not None:
+        candidates = _extract_with_lexbor(html, encoding)
+    else:
+        candidates = _extract_with_soup(html, encoding)
+    return candidates.items
+
+
+def _announcement_id(text: str, pdf_url: Optional[str]) -> str:
+    """De-duplication id of an announcement: its text, plus the PDF URL if any."""
+    return f"{text}|{pdf_url}" if pdf_url else text
 
-    def add_candidate(text: str, pdf_url: Any) -> None:
+
+class _Candidates:
+    """
+    Ordered collection of extracted candidates, de-duplicated as they are added.
+
+    Truthiness reflects whether anything was collected, so the strategies can
+    keep using `if not candidates:` to decide whether to fall back.
+    """
+
+    def __init__(self) -> None:
+        self.items: list[Dict[str, Any]] = []
+        self._seen: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def add(self, text: str, pdf_url: Any) -> None:
+        """Add a whitespace-normalised candidate, skipping empty text and duplicates."""
         cleaned = " ".join(text.split())
         if not cleaned:
             return
-        candidates.append({"text": cleaned, "pdf_url": pdf_url})
+        # Case-folded once here: used for de-duplication and by the keyword
+        # matcher, so detection does no per-candidate string normalisation.
+        text_norm = cleaned.casefold()
+        key = f"{text_norm}|{pdf_url or ''}"
+        if key in self._seen:
+            return
+        self._seen.add(key)
+        self.items.append(
+            {
+                "text": cleaned,
+                "text_norm": text_norm,
+                "pdf_url": pdf_url,
+                "id": _announcement_id(cleaned, pdf_url),
+            }
+        )
+
+
+def _has_class(node: Any, name: str) -> bool:
+    """Return True if a selectolax node carries the given CSS class."""
+    return name in (node.attributes.get("class") or "").split()
+
+
+def _lexbor_pdf_link(node: Any) -> Optional[str]:
+    """Return the first .pdf href inside a selectolax node, if any."""
+    for link in node.css("a"):
+        href = (link.attributes.get("href") or "").strip()
+        if _is_pdf_href(href):
+            return href
+    return None
+
+
+def _document_encoding(html: bytes, encoding: Optional[str]) -> str:
+    """
+    Return the encoding to decode the page with.
+
+    The header charset wins; otherwise the document's own declaration
+    (<meta charset> or an XML declaration) is used when Python knows it, and
+    UTF-8 when there is none.
+    """
+    if encoding:
+        return encoding
+    declared = EncodingDetector.find_declared_encoding(html, is_html=True)
+    if declared:
+        try:
+            return codecs.lookup(declared).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+def _extract_with_lexbor(html: bytes, encoding: str) -> _Candidates:
+    """Run the extraction strategies against a selectolax (lexbor) tree."""
+    # lexbor reads bytes as UTF-8 and ignores <meta charset>, so decode up
+    # front when the header or the document says the page uses something else.
+    if encoding and encoding.lower().replace("_", "-") not in {"utf-8", "utf8"}:
+        tree = LexborHTMLParser(html.decode(encoding, errors="replace"))
+    else:
+        tree = LexborHTMLParser(html)
+    # lexbor's text() includes these, but get_text(strip=True) skips them;
+    # drop them once so the text (and therefore the ids) match the bs4 path.
+    tree.strip_tags(list(_NON_TEXT_TAGS))
+    candidates = _Candidates()
 
     # ------------------------------------------------------------------
     # Primary (college-specific): notifications ticker
     # All notifications are inside a div with BOTH classes:
     #   tg-ticker owl-carousel
     # ------------------------------------------------------------------
-    ticker = soup.select_one("div.tg-ticker.owl-carousel")
-    if ticker:
+    ticker = tree.css_first("div.tg-ticker.owl-carousel")
+    if ticker is not None:
         debug_print("[extract] Found ticker container: div.tg-ticker.owl-carousel")
 
         # PSG-style ticker: notifications are direct children (often <section>).
-        # We parse direct children first to avoid accidentally grabbing unrelated
-        # nested markup.
-        direct_items = ticker.find_all(recursive=False)
+        direct_items = list(ticker.iter())
         debug_print(f"[extract] Ticker direct children found: {len(direct_items)}")
         for item in direct_items:
-            classes = item.get("class", [])
-            if isinstance(classes, list) and "cloned" in classes:
+            if _has_class(item, "cloned"):
                 continue
+            candidates.add(item.text(strip=True), _lexbor_pdf_link(item))
 
-            text = item.get_text(strip=True)
-            pdf_url = None
-            for link in item.select("a"):
-                href = (link.get("href") or "").strip()
-                if href.lower().endswith(".pdf"):
-                    pdf_url = href
-                    break
-            add_candidate(text, pdf_url)
+        # Generic ticker rule: active anchors outside 'cloned' elements. The
+        # :not() clause lets the selector engine reject clones in C.
+        if not candidates:
+            anchors = ticker.css("a.active:not(.cloned a)")
+            debug_print(f"[extract] Ticker active anchors found: {len(anchors)}")
+            for a_tag in anchors:
+                href = (a_tag.attributes.get("href") or "").strip()
+                pdf_url = href if _is_pdf_href(href) else None
+                candidates.add(a_tag.text(strip=True), pdf_url)
+
+        # Final ticker fallback: common OwlCarousel item wrappers.
+        if not candidates:
+            items = ticker.css(".owl-item:not(.cloned), .item:not(.cloned)")
+            debug_print(f"[extract] Ticker item blocks found: {len(items)}")
+            for item in items:
+                candidates.add(item.text(strip=True), _lexbor_pdf_link(item))
+
+    # ------------------------------------------------------------------
+    # Fallback: scan other owl-carousel containers (best-effort resilience)
+    # ------------------------------------------------------------------
+    if not candidates:
+        debug_print("[extract] No ticker candidates; scanning other owl-carousel containers")
+        for carousel in tree.css("div.owl-carousel"):
+            for item in carousel.css("div.owl-item:not(.cloned), div.item:not(.cloned)"):
+                candidates.add(item.text(strip=True), _lexbor_pdf_link(item))
+
+    # ------------------------------------------------------------------
+    # Last resort: whole-page scan (can include navigation items)
+    # ------------------------------------------------------------------
+    if not candidates:
+        debug_print("[extract] No carousel candidates; falling back to generic scanning")
+        # One selector pass over both tags: list items are preferred, bare
+        # anchors are only kept in case no list item yields a candidate.
+        bare_anchors: list[tuple[str, Optional[str]]] = []
+        for node in tree.css("li, a"):
+            is_li = node.tag == "li"
+            if not is_li and candidates:
+                continue
+            text = node.text(strip=True)
+            if not text:
+                continue
+            if is_li:
+                # Only the href matters here, so skip anchors without one.
+                link = node.css_first("a[href]")
+                pdf_url = None
+                if link is not None:
+                    href = (link.attributes.get("href") or "").strip()
+                    if _is_pdf_href(href):
+                        pdf_url = href
+                candidates.add(text, pdf_url)
+            else:
+                href = (node.attributes.get("href") or "").strip()
+                bare_anchors.append((text, href if _is_pdf_href(href) else None))
+
+        if not candidates:
+            for text, pdf_url in bare_anchors:
+                candidates.add(text, pdf_url)
+
+    return candidates
+
+
+class _TickerTarget:
+    """
+    lxml parser target that collects the ticker's direct children as they stream.
+
+    Mirrors the direct-children strategy without building any tree: only the
+    first div with both "tg-ticker" and "owl-carousel" classes is considered,
+    children with class "cloned" are skipped, and each item yields its stripped
+    text (joined like get_text(strip=True), so without script/style contents)
+    plus its first .pdf link.
+    """
+
+    def __init__(self) -> None:
+        self.items: list[tuple[str, Optional[str]]] = []
+        self._depth = 0  # 0 = outside the ticker, 1 = ticker div, 2 = item
+        self._done = False
+        self._skip = False
+        self._ignore = 0  # open _NON_TEXT_TAGS elements inside the ticker
+        self._parts: list[str] = []
+        self._pending: list[str] = []
+        self._pdf_url: Optional[str] = None
+
+    def _flush(self) -> None:
+        # lxml may deliver one text node in several chunks; strip it as a whole.
+        if self._pending:
+            text = "".join(self._pending).strip()
+            if text:
+                self._parts.append(text)
+            self._pending = []
+
+    def start(self, tag: str, attrib: Dict[str, str]) -> None:
+        if self._done:
+            return
+        classes = (attrib.get("class") or "").split()
+        if self._depth == 0:
+            if tag == "div" and "tg-ticker" in classes and "owl-carousel" in classes:
+                self._depth = 1
+            return
+
+        self._flush()
+        self._depth += 1
+        if tag in _NON_TEXT_TAGS:
+            self._ignore += 1
+        if self._depth == 2:
+            self._skip = "cloned" in classes
+            self._parts = []
+            self._pdf_url = None
+        elif tag == "a" and not self._skip and self._pdf_url is None:
+            href = (attrib.get("href") or "").strip()
+            if _is_pdf_href(href):
+                self._pdf_url = href
+
+    def end(self, tag: str) -> None:
+        if self._done or self._depth == 0:
+            return
+        self._flush()
+        if tag in _NON_TEXT_TAGS and self._ignore:
+            self._ignore -= 1
+        if self._depth == 2 and not self._skip:
+            self.items.append(("".join(self._parts), self._pdf_url))
+        self._depth -= 1
+        if self._depth == 0:
+            self._done = True
+
+    def data(self, text: str) -> None:
+        if self._depth >= 2 and not self._skip and not self._ignore:
+            self._pending.append(text)
+
+    def comment(self, text: str) -> None:
+        # get_text(strip=True) strips the text on each side of a comment
+        # separately, so a comment ends the pending text node.
+        self._flush()
+
+    def pi(self, target: str, data: Optional[str] = None) -> None:
+        self._flush()
+
+    def close(self) -> list[tuple[str, Optional[str]]]:
+        return self.items
+
+
+def _soup_text_and_pdf(item: Any) -> tuple[str, Optional[str]]:
+    """
+    Return an element's text and first .pdf link from a single descendants walk.
+
+    The text is joined exactly like get_text(strip=True) (same string types,
+    no separator), so announcement ids match the other strategies.
+    """
+    string_types = item.interesting_string_types
+    parts: list[str] = []
+    pdf_url = None
+    for el in item.descendants:
+        if isinstance(el, NavigableString):
+            if type(el) in string_types:
+                stripped = el.strip()
+                if stripped:
+                    parts.append(stripped)
+        elif pdf_url is None and el.name == "a":
+            href = (el.get("href") or "").strip()
+            if _is_pdf_href(href):
+                pdf_url = href
+    return "".join(parts), pdf_url
+
+
+def _extract_with_soup(html: bytes, encoding: str) -> _Candidates:
+    """
+    Run the extraction strategies with lxml and BeautifulSoup.
+
+    Used when selectolax is not installed. The ticker's direct children are
+    streamed through lxml's target interface first; BeautifulSoup (on the lxml
+    builder) is only used for the remaining fallbacks. The raw bytes are handed
+    to lxml directly with the resolved encoding, since libxml2 would otherwise
+    fall back to Latin-1 for pages without a charset declaration.
+    """
+    candidates = _Candidates()
+
+    # ------------------------------------------------------------------
+    # Primary (college-specific): notifications ticker
+    # All notifications are inside a div with BOTH classes:
+    #   tg-ticker owl-carousel
+    # PSG-style ticker: notifications are direct children (often <section>).
+    # ------------------------------------------------------------------
+    streamed = etree.fromstring(html, etree.HTMLParser(target=_TickerTarget(), encoding=encoding))
+    debug_print(f"[extract] Streamed ticker items found: {len(streamed)}")
+    for text, pdf_url in streamed:
+        candidates.add(text, pdf_url)
+
+    ticker = None
+    if not candidates:
+        ticker_soup = BeautifulSoup(html, "lxml", from_encoding=encoding, parse_only=_TICKER_STRAINER)
+        ticker = ticker_soup.select_one("div.tg-ticker.owl-carousel")
+    if ticker:
+        debug_print("[extract] Found ticker container: div.tg-ticker.owl-carousel")
 
         # Generic ticker rule (if direct-children parsing yields nothing):
         # Look for anchors with class 'active' anywhere inside the ticker and
         # ignore duplicates that are part of a 'cloned' element.
         if not candidates:
-            anchors = ticker.select("a.active")
+            anchors = ticker.select("a.active:not(.cloned a)")
             debug_print(f"[extract] Ticker active anchors found: {len(anchors)}")
             for a_tag in anchors:
-                cloned = False
-                for parent in a_tag.parents:
-                    if not hasattr(parent, "get"):
-                        continue
-                    classes = parent.get("class", [])
-                    if isinstance(classes, list) and "cloned" in classes:
-                        cloned = True
-                        break
-                if cloned:
-                    continue
-
                 text = a_tag.get_text(strip=True)
                 href = (a_tag.get("href") or "").strip()
-                pdf_url = href if href.lower().endswith(".pdf") else None
-                add_candidate(text, pdf_url)
+                pdf_url = href if _is_pdf_href(href) else None
+                candidates.add(text, pdf_url)
 
         # Final ticker fallback: common OwlCarousel item wrappers.
         if not candidates:
-            items = ticker.select(".owl-item, .item")
+            items = ticker.select(".owl-item:not(.cloned), .item:not(.cloned)")
             debug_print(f"[extract] Ticker item blocks found: {len(items)}")
             for item in items:
-                classes = item.get("class", [])
-                if isinstance(classes, list) and "cloned" in classes:
-                    continue
-                text = item.get_text(strip=True)
-                pdf_url = None
-                for link in item.select("a"):
-                    href = (link.get("href") or "").strip()
-                    if href.lower().endswith(".pdf"):
-                        pdf_url = href
-                        break
-                add_candidate(text, pdf_url)
+                candidates.add(*_soup_text_and_pdf(item))
+
+    # Everything below needs more of the page than the ticker subtree, so
+    # only pay for the broader parse when the ticker yielded nothing.
+    if not candidates:
+        soup = BeautifulSoup(html, "lxml", from_encoding=encoding, parse_only=_FALLBACK_STRAINER)
 
     # ------------------------------------------------------------------
     # Fallback: scan other owl-carousel containers (best-effort resilience)
@@ -171,98 +540,186 @@ def extract_announcements(html: str) -> list[Dict[str, Any]]:
     if not candidates:
         debug_print("[extract] No ticker candidates; scanning other owl-carousel containers")
         for carousel in soup.select("div.owl-carousel"):
-            for item in carousel.select("div.owl-item, div.item"):
-                classes = item.get("class", [])
-                if isinstance(classes, list) and "cloned" in classes:
-                    continue
-                text = item.get_text(strip=True)
-                pdf_url = None
-                for link in item.select("a"):
-                    href = (link.get("href") or "").strip()
-                    if href.lower().endswith(".pdf"):
-                        pdf_url = href
-                        break
-                add_candidate(text, pdf_url)
+            for item in carousel.select("div.owl-item:not(.cloned), div.item:not(.cloned)"):
+                candidates.add(*_soup_text_and_pdf(item))
 
     # ------------------------------------------------------------------
     # Last resort: whole-page scan (can include navigation items)
     # ------------------------------------------------------------------
     if not candidates:
         debug_print("[extract] No carousel candidates; falling back to generic scanning")
-        for li in soup.find_all("li"):
-            text = li.get_text(strip=True)
-            if not text:
+        # One tree walk over both tags: list items are preferred, bare anchors
+        # are only kept in case no list item yields a candidate.
+        bare_anchors: list[tuple[str, Optional[str]]] = []
+        for node in soup.find_all(["li", "a"]):
+            is_li = node.name == "li"
+            if not is_li and candidates:
                 continue
-            link = li.find("a")
-            pdf_url = None
-            if link and link.get("href"):
-                href = (link.get("href") or "").strip()
-                if href.lower().endswith(".pdf"):
-                    pdf_url = href
-            add_candidate(text, pdf_url)
-
-    if not candidates:
-        for a in soup.find_all("a"):
-            text = a.get_text(strip=True)
+            text = node.get_text(strip=True)
             if not text:
                 continue
-            href = (a.get("href") or "").strip()
-            pdf_url = href if href.lower().endswith(".pdf") else None
-            add_candidate(text, pdf_url)
+            if is_li:
+                link = node.find("a", href=True)
+                pdf_url = None
+                if link:
+                    href = (link.get("href") or "").strip()
+                    if _is_pdf_href(href):
+                        pdf_url = href
+                candidates.add(text, pdf_url)
+            else:
+                href = (node.get("href") or "").strip()
+                bare_anchors.append((text, href if _is_pdf_href(href) else None))
 
-    # De-duplicate while preserving order.
-    seen: set[str] = set()
-    deduped: list[Dict[str, Any]] = []
-    for cand in candidates:
-        key = f"{(cand.get('text') or '').lower()}|{cand.get('pdf_url') or ''}"
-        if key in seen:
+        if not candidates:
+            for text, pdf_url in bare_anchors:
+                candidates.add(text, pdf_url)
+
+    return candidates
+
+
+def extract_feed_items(xml: bytes) -> list[Dict[str, Any]]:
+    """
+    Extract candidate announcements from an RSS 2.0 or Atom feed.
+
+    Each <item>/<entry> becomes one candidate with the same shape as
+    extract_announcements produces: its title as text, and as the PDF URL
+    the first of its links that points at a PDF (an Atom entry may list an
+    alternate page before the PDF enclosure).
+    """
+    parser = etree.XMLParser(resolve_entities=False, no_network=True)
+    root = etree.fromstring(xml, parser)
+    candidates = _Candidates()
+
+    for entry in root.iter():
+        if not isinstance(entry.tag, str) or etree.QName(entry).localname not in {"item", "entry"}:
             continue
-        seen.add(key)
-        deduped.append(cand)
-    return deduped
+        text = ""
+        pdf_url = None
+        for child in entry:
+            if not isinstance(child.tag, str):
+                continue
+            name = etree.QName(child).localname
+            if name == "title":
+                text = "".join(child.itertext())
+            elif name in {"link", "enclosure"} and pdf_url is None:
+                # Atom links and RSS enclosures carry the URL in an attribute,
+                # RSS <link> in the element text.
+                href = (child.get("href") or child.get("url") or child.text or "").strip()
+                if _is_pdf_href(href):
+                    pdf_url = href
+        candidates.add(text, pdf_url)
+
+    debug_print(f"[extract] Feed items found: {len(candidates)}")
+    return candidates.items
+
+
+@lru_cache(maxsize=None)
+def _keyword_matcher(keyword: str) -> SequenceMatcher:
+    """
+    SequenceMatcher with `keyword` as its second sequence, built once per keyword.
+
+    difflib caches its index of the second sequence, so reusing the matcher
+    and only swapping the first sequence (set_seq1) per candidate avoids
+    rebuilding it for every comparison.
+    """
+    return SequenceMatcher(None, "", keyword)
+
+
+def _is_similar(text_norm: str, keyword: str, threshold: float) -> bool:
+    """
+    Return True if difflib's similarity ratio of text and keyword reaches `threshold`.
+
+    SequenceMatcher is pure Python and slow on long texts, so the cheap upper
+    bounds real_quick_ratio() (lengths only) and quick_ratio() (character
+    counts) are checked first, as get_close_matches does, so most non-matches
+    never reach the full ratio() computation. Only used when rapidfuzz is not
+    installed.
+    """
+    matcher = _keyword_matcher(keyword)
+    matcher.set_seq1(text_norm)
+    return (
+        matcher.real_quick_ratio() >= threshold
+        and matcher.quick_ratio() >= threshold
+        and matcher.ratio() >= threshold
+    )
 
 
-def fuzzy_matches(text: str, keywords: str, threshold: float) -> bool:
+def fuzzy_matches(
+    text_norm: str,
+    keywords: Sequence[str],
+    threshold: float,
+    pattern: Optional[re.Pattern[str]] = None,
+) -> bool:
     """
     Check if any keyword fuzzy-matches the given text above the threshold.
 
-    Keywords are comma-separated. We perform case-insensitive matching using:
-    1. Substring check: if keyword appears anywhere in the text, it's a match
-    2. Fuzzy similarity: if substring check fails, use SequenceMatcher ratio
+    Both the text and the keywords must already be case-folded (keywords also
+    stripped); the extractors and load_config normalise them once.
+    `pattern` is the precompiled keyword alternation from Config, if available.
+    We perform case-insensitive matching using:
+    1. Substring check: if any keyword appears anywhere in the text, it's a match
+       (one regex search when `pattern` is given)
+    2. Fuzzy similarity: only if no keyword is a substring, use the similarity
+       ratio (one rapidfuzz extractOne call over all keywords, or difflib
+       if rapidfuzz is not installed)
 
     This handles both exact substring matches (e.g., "reappearance" in a longer
     announcement text) and fuzzy matches for typos/variations.
     """
-    text_norm = text.lower()
-    for raw_kw in keywords.split(","):
-        kw = raw_kw.strip().lower()
-        if not kw:
-            continue
-        
-        # First check: if keyword appears as substring, it's definitely a match
-        if kw in text_norm:
+    # First check: if any keyword appears as substring, it's definitely a match.
+    # All keywords are tried before scoring so the common case never pays for
+    # a similarity computation.
+    if pattern is not None:
+        if pattern.search(text_norm):
             return True
-        
-        # Second check: fuzzy similarity for partial matches and typos
-        ratio = SequenceMatcher(None, text_norm, kw).ratio()
-        if ratio >= threshold:
+    elif any(kw in text_norm for kw in keywords):
+        return True
+
+    # Second check: fuzzy similarity for partial matches and typos.
+    if process is not None:
+        # rapidfuzz scores are in [0, 100]; extractOne returns None when no
+        # keyword reaches the cutoff.
+        best = process.extractOne(
+            text_norm,
+            keywords,
+            scorer=fuzz.ratio,
+            processor=None,
+            score_cutoff=threshold * 100,
+        )
+        return best is not None
+    for kw in keywords:
+        if _is_similar(text_norm, kw, threshold):
             return True
     return False
 
 
 def detect_announcements(
     candidates: list[Dict[str, Any]],
-    cfg: Config
+    cfg: Config,
+    run_time: Optional[datetime] = None,
+    history: Sequence[Announcement] = (),
 ) -> list[Announcement]:
     """
     Return all candidates that match the fuzzy keyword criteria.
 
-    The 'id' for de-duplication is based on the text (and PDF URL if present).
+    The 'id' for de-duplication is based on the text (and PDF URL if present);
+    candidates from the extractors carry it precomputed. Matches are stamped
+    with `run_time` (defaults to now()).
+
+    Every candidate is checked against the current keywords, so notices
+    that matched under old settings stop matching once the keywords change.
+    Candidates whose id is already in `history` keep their original
+    detection time.
     """
-    now_iso = format_dt(now())
+    now_iso = format_dt(run_time or now())
     debug_print(f"[detect] Checking {len(candidates)} candidates for {cfg.match_keywords!r}")
 
     matches: list[Announcement] = []
+    keywords = cfg.keywords or parse_keywords(cfg.match_keywords)
+    # Configs not built by load_config get their alternation compiled here,
+    # once per run, so the substring pre-filter is always a single search.
+    pattern = cfg.keyword_pattern or compile_keyword_pattern(keywords)
+    known = {ann.id: ann for ann in history}
 
     for cand in candidates:
         text = cand.get("text") or ""
@@ -271,20 +728,33 @@ def detect_announcements(
         if not text:
             continue
 
-        if fuzzy_matches(text, cfg.match_keywords, cfg.similarity_threshold):
-            ann_id = text
-            if pdf_url:
-                ann_id = f"{text}|{pdf_url}"
+        ann_id = cand.get("id") or _announcement_id(text, pdf_url)
 
-            debug_print(f"[detect] Match: {text[:120]!r}")
+        # The substring/regex check inside fuzzy_matches settles most known
+        # notices, so they rarely reach the similarity scoring.
+        if not fuzzy_matches(
+            cand.get("text_norm") or text.casefold(),
+            keywords,
+            cfg.similarity_threshold,
+            pattern,
+        ):
+            continue
 
-            matches.append(
-                Announcement(
-                    id=ann_id,
-                    text=text,
-                    pdf_url=pdf_url,
-                    first_detected=now_iso,
-                )
+        previous = known.get(ann_id)
+        if previous is not None:
+            debug_print(f"[detect] Known: {text[:120]!r}")
+            first_detected = previous.first_detected
+        else:
+            debug_print(f"[detect] Match: {text[:120]!r}")
+            first_detected = now_iso
+
+        matches.append(
+            Announcement(
+                id=ann_id,
+                text=text,
+                pdf_url=pdf_url,
+                first_detected=first_detected,
             )
+        )
 
     return matches
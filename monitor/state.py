@@ -4,11 +4,12 @@ State file operations and state update logic.
 
 from __future__ import annotations
 
-import json
 import os
-from datetime import timedelta
+from datetime import datetime, timedelta
 from typing import Optional
 
+import orjson
+
 from .models import Announcement, MonitorState, Config
 from .utils import now, format_dt, parse_dt, HISTORY_MAX_ANNOUNCEMENTS, HISTORY_MAX_ERRORS
 
@@ -24,8 +25,8 @@ def load_state(path: str) -> MonitorState:
         return MonitorState()
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            raw = json.load(f)
+        with open(path, "rb") as f:
+            raw = orjson.loads(f.read())
         if not isinstance(raw, dict):
             return MonitorState()
         return MonitorState.from_json(raw)
@@ -35,19 +36,49 @@ def load_state(path: str) -> MonitorState:
 
 
 def save_state(path: str, state: MonitorState) -> None:
-    """Persist state atomically to JSON file."""
-    os.makedirs(os.path.dirname(path), exist_ok=True)
+    """
+    Persist state atomically to JSON file.
+
+    Skips the write entirely when the file already holds the same bytes (a run
+    saves several times with one shared timestamp, so repeats are common).
+    """
+    # orjson emits UTF-8 bytes with the same 2-space layout as json.dump(indent=2).
+    data = orjson.dumps(state.to_json(), option=orjson.OPT_INDENT_2)
+    try:
+        with open(path, "rb") as f:
+            if f.read() == data:
+                return
+    except OSError:
+        pass
+
     tmp_path = path + ".tmp"
-    with open(tmp_path, "w", encoding="utf-8") as f:
-        json.dump(state.to_json(), f, ensure_ascii=False, indent=2)
+    try:
+        f = open(tmp_path, "wb")
+    except FileNotFoundError:
+        # load_config creates the state directory at startup; this only
+        # covers callers that pass a path of their own.
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        f = open(tmp_path, "wb")
+    with f:
+        f.write(data)
+        # Flush to disk before the rename so a crash cannot leave a
+        # truncated state file in place of the old one.
+        f.flush()
+        os.fsync(f.fileno())
     os.replace(tmp_path, path)
 
 
-def should_send_error_alert(state: MonitorState, signature: str, cfg: Config) -> bool:
+def should_send_error_alert(
+    state: MonitorState,
+    signature: str,
+    cfg: Config,
+    run_time: Optional[datetime] = None,
+) -> bool:
     """
     Decide whether to send a new error alert to the owner.
 
     We throttle on both time and signature to avoid spamming on repeated failures.
+    `run_time` is the current run's timestamp (defaults to now()).
     """
     if state.error_signature != signature or not state.error_last_alert_time:
         return True
@@ -56,13 +87,18 @@ def should_send_error_alert(state: MonitorState, signature: str, cfg: Config) ->
     if not last_time:
         return True
 
-    delta = now() - last_time
+    delta = (run_time or now()) - last_time
     return delta >= timedelta(minutes=cfg.error_throttle_minutes)
 
 
-def update_for_error(state: MonitorState, error_message: str, cfg: Config) -> MonitorState:
+def update_for_error(
+    state: MonitorState,
+    error_message: str,
+    cfg: Config,
+    run_time: Optional[datetime] = None,
+) -> MonitorState:
     """Update state for a failure and return it."""
-    now_str = format_dt(now())
+    now_str = format_dt(run_time or now())
     state.last_run_time = now_str
     state.last_run_status = "failure"
     state.monitoring_enabled = cfg.monitoring_enabled
@@ -76,9 +112,14 @@ def update_for_error(state: MonitorState, error_message: str, cfg: Config) -> Mo
     return state
 
 
-def update_for_success(state: MonitorState, announcement: Optional[Announcement], cfg: Config) -> MonitorState:
+def update_for_success(
+    state: MonitorState,
+    announcement: Optional[Announcement],
+    cfg: Config,
+    run_time: Optional[datetime] = None,
+) -> MonitorState:
     """Update state for a successful run and return it."""
-    state.last_run_time = format_dt(now())
+    state.last_run_time = format_dt(run_time or now())
     state.last_run_status = "success"
     state.error_signature = None
     state.error_last_alert_time = None
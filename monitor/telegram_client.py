@@ -12,10 +12,27 @@ from .utils import debug_print
 
 
 class TelegramClient:
-    """Simple Telegram client using HTTPS Bot API."""
+    """
+    Simple Telegram client using HTTPS Bot API.
+
+    Messages are sent over one keep-alive session, so a run that sends more
+    than one message reuses the TLS connection to api.telegram.org. Use it as
+    a context manager (or call close()) to release the connection.
+    """
 
     def __init__(self, bot_token: str) -> None:
         self.base_url = f"https://api.telegram.org/bot{bot_token}"
+        self._session = requests.Session()
+
+    def close(self) -> None:
+        """Close the underlying session and its pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> "TelegramClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
 
     def send_message(self, chat_id: str, text: str, parse_mode: str = "HTML", disable_web_page_preview: bool = False) -> None:
         """
@@ -31,7 +48,7 @@ class TelegramClient:
             "disable_web_page_preview": disable_web_page_preview,
         }
         try:
-            resp = requests.post(url, data=payload, timeout=15)
+            resp = self._session.post(url, data=payload, timeout=15)
             if not resp.ok:
                 raise RuntimeError(f"Telegram API error {resp.status_code}: {resp.text}")
         except requests.RequestException as exc:
@@ -15,6 +15,11 @@ from dotenv import load_dotenv
 # College website URL to monitor for announcements.
 DEFAULT_TARGET_URL = "https://www.psgtech.edu"
 
+# Optional RSS/Atom feed carrying the same announcements. When set, the feed
+# is fetched and parsed instead of the homepage HTML (much cheaper and less
+# fragile). Leave as None while the college does not publish one.
+DEFAULT_FEED_URL = None
+
 # Comma-separated keywords used for matching against announcement text.
 DEFAULT_MATCH_KEYWORDS = "time limit exceeded"
 
@@ -24,13 +29,15 @@ DEFAULT_SIMILARITY_THRESHOLD = 0.8
 # Minimum minutes between repeated error alerts with the same signature.
 DEFAULT_ERROR_THROTTLE_MINUTES = 60
 
+# Largest page body (in bytes, after decompression) the monitor will download.
+# The homepage is around 1 MiB; anything far bigger means the server is
+# misbehaving, so the run fails early instead of parsing it.
+MAX_PAGE_BYTES = 4 * 1024 * 1024
+
 # Maximum history sizes for announcements and errors stored in the state file.
 HISTORY_MAX_ANNOUNCEMENTS = 10
 HISTORY_MAX_ERRORS = 50
 
-# ISO format for datetime strings
-ISO_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
-
 
 # ---------------------------------------------------------------------------
 # Environment (if local) and Debugging
@@ -63,13 +70,15 @@ def now() -> datetime:
 
 
 def format_dt(dt: datetime) -> str:
-    """Format a datetime as ISO string."""
-    return dt.strftime(ISO_FORMAT)
+    """Format a datetime as ISO string (seconds precision, e.g. 2024-01-31T09:15:00+00:00)."""
+    return dt.isoformat(timespec="seconds")
 
 
 def parse_dt(raw: str) -> datetime | None:
     """Parse ISO datetime string; return None on failure."""
     try:
-        return datetime.strptime(raw, ISO_FORMAT)
+        # On Python 3.11+ this also accepts the older "+0000" offsets already
+        # stored in state files.
+        return datetime.fromisoformat(raw)
     except Exception:
         return None